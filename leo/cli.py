@@ -21,7 +21,11 @@ from .helper import make_dockerfile, make_docker_compose_file, make_readme_templ
     make_sphinx_index, make_init_template, make_requirements_template, make_kubernetes_kong_template, \
     make_kubernetes_templates, make_metrics_template, make_graphite_templates, make_elk_templates, \
     make_schema_template, make_grafana_templates, make_data_template, make_model_repo_template, \
-    make_train_template
+    make_train_template, make_batching_template, make_artifact_template, make_registry_template, \
+    make_cache_template, make_serialization_template, make_features_template, make_streaming_template, \
+    make_scoring_template, make_local_runtime_template, make_parallel_template, make_admission_template, \
+    make_stages_template, make_logs_template, make_log_shipper_template, make_aggregator_template, \
+    make_exporter_template, make_drift_template
 
 
 def _copy_files(source: str, destination: str, suffix: Optional[str] = '',
@@ -265,10 +269,50 @@ def _generate_package_files(context: CliContext) -> None:
         make_config_template(context, f)
     with open(os.path.join(context.package_path, 'modelrepo.py'), 'w') as f:
         make_model_repo_template(context, f)
+    if not context.use_pyspark:
+        with open(os.path.join(context.package_path, 'artifact.py'), 'w') as f:
+            make_artifact_template(context, f)
     with open(os.path.join(context.package_path, 'data.py'), 'w') as f:
         make_data_template(context, f)
     with open(os.path.join(context.package_path, 'train.py'), 'w') as f:
         make_train_template(context, f)
+    with open(os.path.join(context.package_path, 'batching.py'), 'w') as f:
+        make_batching_template(context, f)
+    with open(os.path.join(context.package_path, 'registry.py'), 'w') as f:
+        make_registry_template(context, f)
+    with open(os.path.join(context.package_path, 'cache.py'), 'w') as f:
+        make_cache_template(context, f)
+    with open(os.path.join(context.package_path, 'serialization.py'), 'w') as f:
+        make_serialization_template(context, f)
+    with open(os.path.join(context.package_path, 'features.py'), 'w') as f:
+        make_features_template(context, f)
+    with open(os.path.join(context.package_path, 'streaming.py'), 'w') as f:
+        make_streaming_template(context, f)
+    with open(os.path.join(context.package_path, 'scoring.py'), 'w') as f:
+        make_scoring_template(context, f)
+    with open(os.path.join(context.package_path, 'admission.py'), 'w') as f:
+        make_admission_template(context, f)
+    with open(os.path.join(context.package_path, 'stages.py'), 'w') as f:
+        make_stages_template(context, f)
+    with open(os.path.join(context.package_path, 'logs.py'), 'w') as f:
+        make_logs_template(context, f)
+    with open(os.path.join(context.package_path, 'drift.py'), 'w') as f:
+        make_drift_template(context, f)
+    if context.use_elk:
+        with open(os.path.join(context.package_path, 'log_shipper.py'), 'w') as f:
+            make_log_shipper_template(context, f)
+    if context.use_prometheus:
+        with open(os.path.join(context.package_path, 'exporter.py'), 'w') as f:
+            make_exporter_template(context, f)
+    if context.use_graphite:
+        with open(os.path.join(context.package_path, 'aggregator.py'), 'w') as f:
+            make_aggregator_template(context, f)
+    if context.use_pyspark:
+        with open(os.path.join(context.package_path, 'local_runtime.py'), 'w') as f:
+            make_local_runtime_template(context, f)
+    else:
+        with open(os.path.join(context.package_path, 'parallel.py'), 'w') as f:
+            make_parallel_template(context, f)
     if context.monitor != 'None':
         _print_console(f'Generating metric files!: {context.monitor}')
         with open(os.path.join(context.package_path, 'metrics.py'), 'w') as f:
@@ -95,6 +95,17 @@ def make_model_repo_template(context: CliContext, target: Optional[TextIO] = Non
     return _make_template('repo/modelrepo.py.jinja2', context, target)
 
 
+def make_artifact_template(context: CliContext, target: Optional[TextIO] = None) -> Optional[str]:
+    """
+    Writes the module which reads and writes pickled model artifacts.
+
+    :param context: Cli context which captures command line arguments and provides utility methods
+    :param target: A stream to write the output to. If None, the output is returned.
+    :return: The artifact.py file as a string if target is None, otherwise nothing.
+    """
+    return _make_template('repo/artifact.py.jinja2', context, target)
+
+
 def make_data_template(context: CliContext, target: Optional[TextIO] = None) -> Optional[str]:
     """
 
@@ -115,6 +126,186 @@ def make_train_template(context: CliContext, target: Optional[TextIO] = None) ->
     return _make_template('train.py.jinja2', context, target)
 
 
+def make_batching_template(context: CliContext, target: Optional[TextIO] = None) -> Optional[str]:
+    """
+    Writes the micro-batching scheduler which groups concurrent prediction requests.
+
+    :param context: Cli context which captures command line arguments and provides utility methods
+    :param target: A stream to write the output to. If None, the output is returned.
+    :return: The batching.py file as a string if target is None, otherwise nothing.
+    """
+    return _make_template('batching.py.jinja2', context, target)
+
+
+def make_registry_template(context: CliContext, target: Optional[TextIO] = None) -> Optional[str]:
+    """
+    Writes the registry which serves several models and versions of them from a single process.
+
+    :param context: Cli context which captures command line arguments and provides utility methods
+    :param target: A stream to write the output to. If None, the output is returned.
+    :return: The registry.py file as a string if target is None, otherwise nothing.
+    """
+    return _make_template('registry.py.jinja2', context, target)
+
+
+def make_cache_template(context: CliContext, target: Optional[TextIO] = None) -> Optional[str]:
+    """
+    Writes the prediction cache, which caches predictions per input row and model version.
+
+    :param context: Cli context which captures command line arguments and provides utility methods
+    :param target: A stream to write the output to. If None, the output is returned.
+    :return: The cache.py file as a string if target is None, otherwise nothing.
+    """
+    return _make_template('cache.py.jinja2', context, target)
+
+
+def make_serialization_template(context: CliContext, target: Optional[TextIO] = None) -> Optional[str]:
+    """
+    Writes the binary request and response formats (NPY, Arrow, MessagePack) of the prediction endpoints.
+
+    :param context: Cli context which captures command line arguments and provides utility methods
+    :param target: A stream to write the output to. If None, the output is returned.
+    :return: The serialization.py file as a string if target is None, otherwise nothing.
+    """
+    return _make_template('serialization.py.jinja2', context, target)
+
+
+def make_features_template(context: CliContext, target: Optional[TextIO] = None) -> Optional[str]:
+    """
+    Writes the fast validator for request schemas which are declared as feature vectors.
+
+    :param context: Cli context which captures command line arguments and provides utility methods
+    :param target: A stream to write the output to. If None, the output is returned.
+    :return: The features.py file as a string if target is None, otherwise nothing.
+    """
+    return _make_template('features.py.jinja2', context, target)
+
+
+def make_streaming_template(context: CliContext, target: Optional[TextIO] = None) -> Optional[str]:
+    """
+    Writes the NDJSON and CSV streaming support of the bulk prediction endpoint.
+
+    :param context: Cli context which captures command line arguments and provides utility methods
+    :param target: A stream to write the output to. If None, the output is returned.
+    :return: The streaming.py file as a string if target is None, otherwise nothing.
+    """
+    return _make_template('streaming.py.jinja2', context, target)
+
+
+def make_scoring_template(context: CliContext, target: Optional[TextIO] = None) -> Optional[str]:
+    """
+    Writes the offline batch scoring of files, which the score command of the project CLI runs. Spark projects get a
+    Spark job, other projects a multiprocessing pipeline.
+
+    :param context: Cli context which captures command line arguments and provides utility methods
+    :param target: A stream to write the output to. If None, the output is returned.
+    :return: The scoring.py file as a string if target is None, otherwise nothing.
+    """
+    if context.use_pyspark:
+        return _make_template('spark_scoring.py.jinja2', context, target)
+    return _make_template('scoring.py.jinja2', context, target)
+
+
+def make_local_runtime_template(context: CliContext, target: Optional[TextIO] = None) -> Optional[str]:
+    """
+    Writes the local runtime, which serves trained Spark pipelines without a Spark session.
+
+    :param context: Cli context which captures command line arguments and provides utility methods
+    :param target: A stream to write the output to. If None, the output is returned.
+    :return: The local_runtime.py file as a string if target is None, otherwise nothing.
+    """
+    return _make_template('local_runtime.py.jinja2', context, target)
+
+
+def make_admission_template(context: CliContext, target: Optional[TextIO] = None) -> Optional[str]:
+    """
+    Writes the admission control of the prediction endpoints, which sheds requests once a worker is saturated.
+
+    :param context: Cli context which captures command line arguments and provides utility methods
+    :param target: A stream to write the output to. If None, the output is returned.
+    :return: The admission.py file as a string if target is None, otherwise nothing.
+    """
+    return _make_template('admission.py.jinja2', context, target)
+
+
+def make_logs_template(context: CliContext, target: Optional[TextIO] = None) -> Optional[str]:
+    """
+    Writes the logging setup of the prediction endpoints, which samples the logged requests and emits the records on a
+    background thread.
+
+    :param context: Cli context which captures command line arguments and provides utility methods
+    :param target: A stream to write the output to. If None, the output is returned.
+    :return: The logs.py file as a string if target is None, otherwise nothing.
+    """
+    return _make_template('logs.py.jinja2', context, target)
+
+
+def make_log_shipper_template(context: CliContext, target: Optional[TextIO] = None) -> Optional[str]:
+    """
+    Writes the shipping of log records to Logstash, in compressed batches with a local spool.
+
+    :param context: Cli context which captures command line arguments and provides utility methods
+    :param target: A stream to write the output to. If None, the output is returned.
+    :return: The log_shipper.py file as a string if target is None, otherwise nothing.
+    """
+    return _make_template('log_shipper.py.jinja2', context, target)
+
+
+def make_aggregator_template(context: CliContext, target: Optional[TextIO] = None) -> Optional[str]:
+    """
+    Writes the in-process aggregation of the Graphite metrics, which are sent in batches from a background thread.
+
+    :param context: Cli context which captures command line arguments and provides utility methods
+    :param target: A stream to write the output to. If None, the output is returned.
+    :return: The aggregator.py file as a string if target is None, otherwise nothing.
+    """
+    return _make_template('aggregator.py.jinja2', context, target)
+
+
+def make_exporter_template(context: CliContext, target: Optional[TextIO] = None) -> Optional[str]:
+    """
+    Writes the export of the Prometheus metrics of all workers, which compacts the metrics of exited workers.
+
+    :param context: Cli context which captures command line arguments and provides utility methods
+    :param target: A stream to write the output to. If None, the output is returned.
+    :return: The exporter.py file as a string if target is None, otherwise nothing.
+    """
+    return _make_template('exporter.py.jinja2', context, target)
+
+
+def make_drift_template(context: CliContext, target: Optional[TextIO] = None) -> Optional[str]:
+    """
+    Writes the monitoring of the drift of the inputs and predictions of the model away from its training data.
+
+    :param context: Cli context which captures command line arguments and provides utility methods
+    :param target: A stream to write the output to. If None, the output is returned.
+    :return: The drift.py file as a string if target is None, otherwise nothing.
+    """
+    return _make_template('drift.py.jinja2', context, target)
+
+
+def make_stages_template(context: CliContext, target: Optional[TextIO] = None) -> Optional[str]:
+    """
+    Writes the timing of the stages of the prediction requests, which are recorded as latency histograms.
+
+    :param context: Cli context which captures command line arguments and provides utility methods
+    :param target: A stream to write the output to. If None, the output is returned.
+    :return: The stages.py file as a string if target is None, otherwise nothing.
+    """
+    return _make_template('stages.py.jinja2', context, target)
+
+
+def make_parallel_template(context: CliContext, target: Optional[TextIO] = None) -> Optional[str]:
+    """
+    Writes the parallel prediction of large requests, for projects which are not based on Spark.
+
+    :param context: Cli context which captures command line arguments and provides utility methods
+    :param target: A stream to write the output to. If None, the output is returned.
+    :return: The parallel.py file as a string if target is None, otherwise nothing.
+    """
+    return _make_template('parallel.py.jinja2', context, target)
+
+
 def _make_template(template_name: str, context: CliContext, target: Optional[TextIO] = None, **template_args) -> \
 Optional[str]:
     template = _loader.load(_jinja_env, f'{_template_folder}/{template_name}')